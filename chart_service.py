@@ -19,53 +19,160 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 This service is licensed under GPL v3+ to comply with Kerykeion's licensing requirements.
 """
 
-from flask import Flask, request, jsonify
+from quart import Quart, Response, request
+import asyncio
+import atexit
+import concurrent.futures
+import hashlib
 import json
-import sys
-import traceback
+import logging
+import logging.handlers
+import os
+import queue
 from kerykeion_chart_generator import generate_chart
 
-app = Flask(__name__)
+# orjson parses and serializes several times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
+def _json_response(payload, status=200):
+    return Response(_json_dumps(payload), status=status, mimetype='application/json')
+
+# Log records go onto an in-process queue; a background listener thread
+# does the actual stream I/O so request handlers never block on stderr.
+_LOG_QUEUE = queue.Queue(-1)
+logger = logging.getLogger("chart")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, logging.StreamHandler())
+_LOG_LISTENER.start()
+# The drain thread is a daemon; stop it at exit so records still queued
+# when the process shuts down get flushed instead of silently dropped
+atexit.register(_LOG_LISTENER.stop)
+
+app = Quart(__name__)
+
+def _warm_up():
+    """
+    Build one throwaway subject at import time so Kerykeion and swisseph
+    populate their lazy caches (ephemeris mmaps included) before a
+    preloading server forks its workers - each worker then inherits the
+    warm state copy-on-write instead of re-initializing it.
+    """
+    try:
+        from kerykeion import AstrologicalSubject
+        AstrologicalSubject(
+            name="warm", year=2000, month=1, day=1, hour=12, minute=0,
+            city="London", nation="GB",
+            lng=-0.1276, lat=51.5074, tz_str="UTC", online=False
+        )
+    except Exception:
+        logger.warning("kerykeion warm-up failed", exc_info=True)
+
+if os.environ.get('CHART_SERVICE_SKIP_WARMUP') != '1':
+    _warm_up()
+
+# Chart generation is synchronous, CPU-heavy Kerykeion work; run it on a
+# bounded thread pool so the event loop keeps accepting requests while
+# charts render concurrently.
+POOL = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Upper bound on charts per batch request; oversize batches get a 413
+MAX_BATCH_SIZE = 32
 
 @app.route('/health', methods=['GET'])
-def health_check():
-    return jsonify({"status": "healthy", "service": "chart-generator"})
+async def health_check():
+    return _json_response({"status": "healthy", "service": "chart-generator"})
 
 @app.route('/generate-chart', methods=['POST'])
-def generate_chart_endpoint():
+async def generate_chart_endpoint():
     try:
         # Get JSON input data
-        input_data = request.get_json()
-        
+        body = await request.get_data()
+        input_data = _json_loads(body) if body else None
+
         if not input_data:
-            return jsonify({"error": "No input data provided"}), 400
-        
-        # Debug log
+            return _json_response({"error": "No input data provided"}, status=400)
+
         is_transit = input_data.get('is_transit', False)
         chart_name = input_data.get('chart_data', {}).get('name', 'Unknown')
-        import logging
-        logging.warning(f"Flask: Generating chart for {chart_name}, is_transit={is_transit}")
-        print(f"Flask: Generating chart for {chart_name}, is_transit={is_transit}")
-        
-        # Generate chart using existing Kerykeion code
-        svg_content = generate_chart(input_data)
-        
-        return jsonify({
+        logger.info("generating chart name=%s transit=%s", chart_name, is_transit)
+
+        # Generate chart using existing Kerykeion code, off the event loop
+        loop = asyncio.get_running_loop()
+        svg_content = await loop.run_in_executor(POOL, generate_chart, input_data)
+
+        # ?format=svg returns the raw SVG bytes instead of JSON-wrapping
+        # them - no decode/escape pass at all, and clients can cache by ETag
+        if request.args.get('format') == 'svg':
+            etag = '"%s"' % hashlib.blake2b(svg_content, digest_size=16).hexdigest()
+            if request.headers.get('If-None-Match') == etag:
+                return Response(status=304, headers={"ETag": etag})
+            return Response(
+                svg_content,
+                mimetype='image/svg+xml',
+                headers={"ETag": etag}
+            )
+
+        # JSON clients still get text; this is the only decode on the path
+        return _json_response({
             "success": True,
-            "svg_content": svg_content
+            "svg_content": svg_content.decode('utf-8')
         })
-        
+
     except Exception as e:
-        # Log error details
-        print(f"Chart generation error: {e}", file=sys.stderr)
-        traceback.print_exc(file=sys.stderr)
-        
+        # Log error details (traceback included, formatted off-thread)
+        logger.exception("chart generation failed")
+
         # Return error response
-        return jsonify({
+        return _json_response({
+            "success": False,
+            "error": str(e)
+        }, status=500)
+
+@app.route('/generate-charts', methods=['POST'])
+async def generate_charts_endpoint():
+    """Batch endpoint: render several charts in one request, in parallel."""
+    try:
+        body = await request.get_data()
+        input_data = _json_loads(body) if body else None
+
+        if not input_data or not isinstance(input_data.get('charts'), list):
+            return _json_response({"error": "Request body must contain a 'charts' list"}, status=400)
+
+        charts = input_data['charts']
+        if len(charts) > MAX_BATCH_SIZE:
+            return _json_response({
+                "error": f"Batch too large: {len(charts)} charts (max {MAX_BATCH_SIZE})"
+            }, status=413)
+
+        # Fan the batch out over the worker pool; results come back in order
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(POOL, generate_chart, chart) for chart in charts
+        ])
+
+        return _json_response({
+            "success": True,
+            "results": [svg.decode('utf-8') for svg in results]
+        })
+
+    except Exception as e:
+        logger.exception("batch chart generation failed")
+
+        return _json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, status=500)
 
 if __name__ == '__main__':
-    # Run on all interfaces, port 5000
+    # Run on all interfaces, port 5000 (use hypercorn with multiple
+    # workers in production: hypercorn -b 0.0.0.0:5000 -w 4 chart_service:app)
     app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
@@ -5,12 +5,19 @@ Properly configured for Lucy bot's three data sources with wheel-only SVG charts
 Supports: user_profiles, idols, charts tables with dynamic chart preferences.
 """
 
+import functools
+import glob
+import hashlib
 import json
+import re
 import sys
 import os
+import tempfile
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional, Any
+from types import MappingProxyType
+from xml.sax.saxutils import escape as _xml_escape
+from typing import Dict, List, Mapping, Tuple, Optional, Any
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -31,6 +38,239 @@ except ImportError as e:
     print(f"Error: Kerykeion library not available: {e}", file=sys.stderr)
     KERYKEION_AVAILABLE = False
 
+# Optional SVG minifier - scour strips comments, metadata, and redundant
+# whitespace from Kerykeion's output, cutting the Discord payload size
+try:
+    from scour import scour as _scour
+    SCOUR_AVAILABLE = True
+except ImportError:
+    SCOUR_AVAILABLE = False
+
+
+# Country name -> ISO code mapping for Kerykeion, built once at import so
+# chart generation never reallocates it (and both call sites stay in sync)
+_COUNTRY_TO_ISO: Mapping[str, str] = MappingProxyType({
+    'United States': 'US',
+    'United Kingdom': 'GB',
+    'Canada': 'CA',
+    'Australia': 'AU',
+    'Germany': 'DE',
+    'France': 'FR',
+    'Italy': 'IT',
+    'Spain': 'ES',
+    'Netherlands': 'NL',
+    'Belgium': 'BE',
+    'Switzerland': 'CH',
+    'Austria': 'AT',
+    'Japan': 'JP',
+    'China': 'CN',
+    'India': 'IN',
+    'Brazil': 'BR',
+    'Mexico': 'MX',
+    'Argentina': 'AR',
+    'Russia': 'RU',
+    'Norway': 'NO',
+    'Sweden': 'SE',
+    'Denmark': 'DK',
+    'Finland': 'FI',
+    'Poland': 'PL',
+    'Czech Republic': 'CZ',
+    'Hungary': 'HU',
+    'Ireland': 'IE',
+    'Portugal': 'PT',
+    'Greece': 'GR',
+    'Turkey': 'TR',
+    'Israel': 'IL',
+    'Egypt': 'EG',
+    'South Africa': 'ZA',
+    'New Zealand': 'NZ',
+    'South Korea': 'KR',
+    'Thailand': 'TH',
+    'Singapore': 'SG',
+    'Philippines': 'PH',
+    'Malaysia': 'MY',
+    'Indonesia': 'ID',
+    'Vietnam': 'VN',
+    'Chile': 'CL',
+    'Colombia': 'CO',
+    'Peru': 'PE',
+    'Venezuela': 'VE',
+    'Ukraine': 'UA',
+    'Romania': 'RO',
+    'Bulgaria': 'BG',
+    'Croatia': 'HR',
+    'Serbia': 'RS',
+    'Slovenia': 'SI',
+    'Slovakia': 'SK',
+    'Lithuania': 'LT',
+    'Latvia': 'LV',
+    'Estonia': 'EE',
+    'Iceland': 'IS',
+    'Luxembourg': 'LU',
+    'Malta': 'MT',
+    'Cyprus': 'CY'
+})
+
+
+def _extract_birth_fields(data: Dict[str, Any], prefix: str, default_name: str,
+                          coord_prefix: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Remap one source-table row onto the canonical chart data shape.
+
+    `prefix` selects the birth_* key family; `coord_prefix` covers sources
+    whose latitude/longitude/timezone keys are prefixed differently.
+    """
+    if coord_prefix is None:
+        coord_prefix = prefix
+    return {
+        'name': data.get('name', default_name),
+        'birth_date': data.get(prefix + 'date'),
+        'birth_time': data.get(prefix + 'time', '12:00'),
+        'birth_city': data.get(prefix + 'city'),
+        'birth_country': data.get(prefix + 'country'),
+        'latitude': data.get(coord_prefix + 'latitude'),
+        'longitude': data.get(coord_prefix + 'longitude'),
+        'timezone': data.get(coord_prefix + 'timezone', 'UTC')
+    }
+
+
+def _from_user_profile(chart_input: Dict[str, Any]) -> Dict[str, Any]:
+    # From user_profiles table
+    return _extract_birth_fields(chart_input, 'chart_birth_', 'Profile Chart')
+
+
+def _from_idol(chart_input: Dict[str, Any]) -> Dict[str, Any]:
+    # From idols table
+    return _extract_birth_fields(chart_input, 'birth_', 'Celebrity Chart')
+
+
+def _from_chart(chart_input: Dict[str, Any]) -> Dict[str, Any]:
+    # From charts table
+    return _extract_birth_fields(chart_input, 'birth_', 'Saved Chart')
+
+
+def _from_processed_chart_data(chart_input: Dict[str, Any]) -> Dict[str, Any]:
+    # From processed chart data (Swiss Ephemeris format)
+    chart_data = chart_input.get('chart_data', {})
+    return _extract_birth_fields(chart_data, 'birth_', 'Processed Chart', coord_prefix='')
+
+
+def _from_generic(chart_input: Dict[str, Any]) -> Dict[str, Any]:
+    # Generic chart data
+    return chart_input.get('chart_data', {})
+
+
+# source_type -> extractor dispatch, resolved with one dict lookup per request
+_EXTRACTORS = {
+    'user_profile': _from_user_profile,
+    'idol': _from_idol,
+    'chart': _from_chart,
+    'processed_chart_data': _from_processed_chart_data
+}
+
+
+# Kerykeion resolves (city, nation) through a geonames lookup, often a
+# network round-trip. Resolved coordinates are cached per process so each
+# location pays for the lookup at most once. Caveat: the shipped service
+# (chart_service.py) imports kerykeion_chart_generator, not this module,
+# and this module's own entry point is a one-shot CLI - so the cache
+# (like the render lru_cache) only pays off when DynamicNatalGenerator
+# is imported into a long-lived host process.
+_GEO_CACHE: Dict[Tuple[str, str], Tuple[float, float, str]] = {}
+
+
+# Precompiled patterns for _optimize_for_discord - one pass picks up both
+# dimensions from the opening <svg> tag. The xmlns probe must stay
+# quote-agnostic: kerykeion emits single-quoted attributes, and injecting
+# a second xmlns next to one we failed to recognize produces invalid XML
+# (and kills scour with a duplicate-attribute error).
+_WH_RE = re.compile(r'width="(\d+)"[^>]*?height="(\d+)"')
+_SVG_XMLNS = 'xmlns="http://www.w3.org/2000/svg"'
+
+# Error SVG shell built once at import; only the truncated message varies
+_ERROR_SVG_TMPL = '''<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" viewBox="0 0 400 400">
+            <circle cx="200" cy="200" r="180" fill="none" stroke="#666" stroke-width="2"/>
+            <text x="200" y="180" text-anchor="middle" font-family="Arial, sans-serif" font-size="16" fill="#666">
+                Chart Generation Error
+            </text>
+            <text x="200" y="220" text-anchor="middle" font-family="Arial, sans-serif" font-size="12" fill="#999">
+                %s
+            </text>
+        </svg>'''
+
+# Fully-baked fallback emitted by main() on catastrophic errors
+_FATAL_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" viewBox="0 0 400 400">
+            <circle cx="200" cy="200" r="180" fill="none" stroke="#ff4444" stroke-width="3"/>
+            <text x="200" y="200" text-anchor="middle" font-family="Arial, sans-serif" font-size="18" fill="#ff4444">
+                Chart System Error
+            </text>
+        </svg>'''
+
+# Fallback minification patterns used when scour is not installed
+_SVG_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_SVG_INTERTAG_WS_RE = re.compile(r'>\s+<')
+
+
+def _minify_svg(svg_content: str) -> str:
+    """
+    Shrink an SVG string before it goes over the wire.
+
+    Uses scour when available; otherwise falls back to stripping comments
+    and collapsing whitespace between tags.
+    """
+    if SCOUR_AVAILABLE:
+        try:
+            options = _scour.sanitizeOptions()
+            options.remove_metadata = True
+            options.strip_comments = True
+            options.indent_type = 'none'
+            options.newlines = False
+            return _scour.scourString(svg_content, options)
+        except Exception as e:
+            print(f"Warning: scour minification failed: {e}", file=sys.stderr)
+
+    svg_content = _SVG_COMMENT_RE.sub('', svg_content)
+    return _SVG_INTERTAG_WS_RE.sub('><', svg_content).strip()
+
+
+def _parse_ymdhm(date_str: str, time_str: str = '12:00') -> Tuple[int, int, int, int, int]:
+    """
+    Parse birth date/time into (year, month, day, hour, minute).
+
+    Fast path slices the ISO strings straight to ints without building a
+    datetime; anything it does not understand falls back to
+    datetime.fromisoformat.
+    """
+    try:
+        year = int(date_str[0:4])
+        month = int(date_str[5:7])
+        day = int(date_str[8:10])
+        if len(date_str) > 10 and date_str[10] == 'T':
+            hour = int(date_str[11:13])
+            minute = int(date_str[14:16])
+        else:
+            head, _, rest = (time_str or '12:00').partition(':')
+            hour = int(head)
+            minute = int(rest[:2] or 0)
+        return year, month, day, hour, minute
+    except (ValueError, IndexError):
+        if 'T' in date_str:
+            birth_datetime = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        else:
+            birth_datetime = datetime.fromisoformat(f"{date_str}T{time_str}")
+        return (birth_datetime.year, birth_datetime.month, birth_datetime.day,
+                birth_datetime.hour, birth_datetime.minute)
+
+
+def _canonical_key(chart_data: Dict[str, Any]) -> str:
+    """
+    Stable 128-bit hex digest of a chart data dict, insensitive to key order.
+    Used to cache rendered SVGs for repeated chart inputs.
+    """
+    frozen = json.dumps(chart_data, sort_keys=True, default=str)
+    return hashlib.blake2b(frozen.encode('utf-8'), digest_size=16).hexdigest()
+
+
 class DynamicNatalGenerator:
     """
     Dynamic chart generator using natal-0.9.4 with Swiss Ephemeris API integration.
@@ -69,61 +309,16 @@ class DynamicNatalGenerator:
             
             # Get options for chart generation
             options = chart_input.get('options', {})
-            theme = options.get('theme', 'dark')
-            
-            # Create AstrologicalSubject
-            subject = self._create_astrological_subject(chart_data)
-            
-            # Create chart SVG generator (minimal parameters)
-            chart_svg = KerykeionChartSVG(subject)
-            
-            # Set up working directory for file generation
-            import glob
-            import os
-            original_cwd = os.getcwd()
-            
-            # Use /tmp directory directly (most permissive)
-            print(f"DEBUG: Current working directory before: {os.getcwd()}", file=sys.stderr)
-            print(f"DEBUG: Changing to /tmp directory", file=sys.stderr)
-            os.chdir("/tmp")
-            print(f"DEBUG: Current working directory after: {os.getcwd()}", file=sys.stderr)
-            print(f"DEBUG: /tmp permissions: {oct(os.stat('/tmp').st_mode)[-3:]}", file=sys.stderr)
-            
-            try:
-                # Test if we can write to /tmp
-                test_file = "/tmp/test_write_py.txt"
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
-                print(f"DEBUG: /tmp write test successful", file=sys.stderr)
-                
-                # Generate wheel-only SVG (creates file, doesn't return content)
-                print(f"DEBUG: About to call makeWheelOnlySVG()", file=sys.stderr)
-                chart_svg.makeWheelOnlySVG()
-                print(f"DEBUG: makeWheelOnlySVG() completed", file=sys.stderr)
-                
-                # Find the generated SVG file in both /tmp and current directory
-                svg_files = []
-                svg_files.extend(glob.glob(os.path.join("/tmp", "*.svg")))
-                svg_files.extend(glob.glob(os.path.join(os.getcwd(), "*.svg")))
-                
-                if svg_files:
-                    # Read the most recently created SVG file
-                    svg_file = max(svg_files, key=os.path.getctime)
-                    with open(svg_file, 'r') as f:
-                        svg_content = f.read()
-                    
-                    # Clean up the file
-                    os.remove(svg_file)
-                    
-                    # Post-process for Discord display
-                    return self._optimize_for_discord(svg_content, {}, options)
-                else:
-                    return self._generate_error_svg("Kerykeion failed to generate SVG file")
-            finally:
-                # Always restore original working directory
-                os.chdir(original_cwd)
-            
+
+            # Render through the LRU cache - repeated inputs (saved charts,
+            # idols, repeated Discord views) return the cached SVG directly
+            cache_key = _canonical_key({'chart_data': chart_data, 'options': options})
+            return self._render_svg(
+                cache_key,
+                json.dumps(chart_data, sort_keys=True, default=str),
+                json.dumps(options, sort_keys=True, default=str)
+            )
+
         except Exception as e:
             print(f"Chart generation error: {e}", file=sys.stderr)
             import traceback
@@ -135,142 +330,159 @@ class DynamicNatalGenerator:
             if hasattr(e, 'filename') and e.filename:
                 error_details += f" (file: {e.filename})"
             return self._generate_error_svg(f"Generation failed: {error_details}")
-    
+
+    @functools.lru_cache(maxsize=1024)
+    def _render_svg(self, cache_key: str, frozen_chart_data: str, frozen_options: str) -> str:
+        """
+        Render a natal chart SVG, memoized on the canonical input hash.
+
+        Takes the chart data and options as canonical JSON strings so the
+        arguments are hashable; errors raise so failures are never cached.
+        """
+        chart_data = json.loads(frozen_chart_data)
+        options = json.loads(frozen_options)
+
+        # Create AstrologicalSubject
+        subject = self._build_subject(chart_data)
+
+        # Generate the wheel-only SVG into a per-request temporary directory;
+        # no chdir, so concurrent requests never interfere with each other
+        with tempfile.TemporaryDirectory() as temp_dir:
+            chart_svg = KerykeionChartSVG(subject, new_output_directory=temp_dir)
+            svg_content = self._render_wheel_svg(chart_svg, temp_dir)
+
+        # Post-process for Discord display
+        return self._optimize_for_discord(svg_content, {}, options)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Expose hit/miss statistics for the SVG render caches.
+        """
+        return {
+            'natal': self._render_svg.cache_info()._asdict(),
+            'synastry': self._render_synastry_svg.cache_info()._asdict()
+        }
+
+    def _render_wheel_svg(self, chart_svg: Any, temp_dir: str) -> str:
+        """
+        Render the wheel-only SVG, preferring Kerykeion's in-memory
+        template renderer over the write-then-read file path.
+
+        makeWheelOnlyTemplate returns the fully-rendered document as a
+        string, skipping file I/O and the directory scan entirely; older
+        Kerykeion versions without it fall back to makeWheelOnlySVG plus
+        reading the emitted file.
+        """
+        render_template = getattr(chart_svg, 'makeWheelOnlyTemplate', None)
+        if render_template is not None:
+            svg_content = render_template(minify=True)
+            if svg_content and '<svg' in svg_content:
+                return svg_content
+
+        # Generate wheel-only SVG (creates file, doesn't return content)
+        chart_svg.makeWheelOnlySVG()
+
+        subject_name = getattr(getattr(chart_svg, 'user', None), 'name', None)
+        chart_type = getattr(chart_svg, 'chart_type', 'Natal')
+        return self._read_generated_svg(temp_dir, subject_name, chart_type)
+
+    def _read_generated_svg(self, temp_dir: str, subject_name: Optional[str] = None,
+                            chart_type: str = 'Natal') -> str:
+        """
+        Read the SVG file Kerykeion wrote into the given temporary directory.
+
+        Kerykeion derives the filename from the subject name and chart type,
+        so the expected paths are tried first; the directory scan only runs
+        if the naming convention does not match.
+        """
+        if subject_name:
+            for candidate in (f"{subject_name} - {chart_type} Chart - Wheel Only.svg",
+                              f"{subject_name} - {chart_type} Chart.svg"):
+                try:
+                    with open(os.path.join(temp_dir, candidate), 'r') as f:
+                        return f.read()
+                except FileNotFoundError:
+                    continue
+
+        svg_files = glob.glob(os.path.join(temp_dir, "*.svg"))
+        if not svg_files:
+            raise RuntimeError("Kerykeion failed to generate SVG file")
+
+        svg_file = max(svg_files, key=os.path.getctime)
+        with open(svg_file, 'r') as f:
+            return f.read()
+
     def _extract_chart_data(self, chart_input: Dict[str, Any], source_type: str) -> Optional[Dict[str, Any]]:
         """
         Extract chart data from different Lucy bot data sources.
         """
         try:
-            if source_type == 'user_profile':
-                # From user_profiles table
-                return {
-                    'name': chart_input.get('name', 'Profile Chart'),
-                    'birth_date': chart_input.get('chart_birth_date'),
-                    'birth_time': chart_input.get('chart_birth_time', '12:00'),
-                    'birth_city': chart_input.get('chart_birth_city'),
-                    'birth_country': chart_input.get('chart_birth_country'),
-                    'latitude': chart_input.get('chart_birth_latitude'),
-                    'longitude': chart_input.get('chart_birth_longitude'),
-                    'timezone': chart_input.get('chart_birth_timezone', 'UTC')
-                }
-            
-            elif source_type == 'idol':
-                # From idols table
-                return {
-                    'name': chart_input.get('name', 'Celebrity Chart'),
-                    'birth_date': chart_input.get('birth_date'),
-                    'birth_time': chart_input.get('birth_time', '12:00'),
-                    'birth_city': chart_input.get('birth_city'),
-                    'birth_country': chart_input.get('birth_country'),
-                    'latitude': chart_input.get('birth_latitude'),
-                    'longitude': chart_input.get('birth_longitude'),
-                    'timezone': chart_input.get('birth_timezone', 'UTC')
-                }
-            
-            elif source_type == 'chart':
-                # From charts table
-                return {
-                    'name': chart_input.get('name', 'Saved Chart'),
-                    'birth_date': chart_input.get('birth_date'),
-                    'birth_time': chart_input.get('birth_time', '12:00'),
-                    'birth_city': chart_input.get('birth_city'),
-                    'birth_country': chart_input.get('birth_country'),
-                    'latitude': chart_input.get('birth_latitude'),
-                    'longitude': chart_input.get('birth_longitude'),
-                    'timezone': chart_input.get('birth_timezone', 'UTC')
-                }
-            
-            elif source_type == 'processed_chart_data':
-                # From processed chart data (Swiss Ephemeris format)
-                chart_data = chart_input.get('chart_data', {})
-                return {
-                    'name': chart_data.get('name', 'Processed Chart'),
-                    'birth_date': chart_data.get('birth_date'),
-                    'birth_time': chart_data.get('birth_time', '12:00'),
-                    'birth_city': chart_data.get('birth_city'),
-                    'birth_country': chart_data.get('birth_country'),
-                    'latitude': chart_data.get('latitude'),
-                    'longitude': chart_data.get('longitude'),
-                    'timezone': chart_data.get('timezone', 'UTC')
-                }
-            
-            else:
-                # Generic chart data
-                return chart_input.get('chart_data', {})
-                
+            return _EXTRACTORS.get(source_type, _from_generic)(chart_input)
+
         except Exception as e:
             print(f"Error extracting chart data: {e}", file=sys.stderr)
             return None
     
-    def _create_astrological_subject(self, chart_data: Dict[str, Any]):
+    def _build_subject(self, chart_data: Dict[str, Any], *, default_country: str = 'GB'):
         """
-        Create Kerykeion AstrologicalSubject from chart data.
+        Create a Kerykeion AstrologicalSubject from normalized chart data.
         """
         # Parse birth date and time
         birth_date_str = chart_data.get('birth_date')
-        birth_time_str = chart_data.get('birth_time', '12:00:00')
-        
-        # Extract date components
+        birth_time_str = chart_data.get('birth_time', '12:00')
+
         if isinstance(birth_date_str, str):
-            if 'T' in birth_date_str:  # ISO format
-                birth_datetime = datetime.fromisoformat(birth_date_str.replace('Z', '+00:00'))
-            else:
-                # Date only, add time
-                birth_datetime = datetime.fromisoformat(f"{birth_date_str}T{birth_time_str}")
+            year, month, day, hour, minute = _parse_ymdhm(birth_date_str, birth_time_str)
         else:
             # Fallback
-            birth_datetime = datetime(1990, 1, 1, 12, 0)
-        
-        # Extract time components
-        hour = birth_datetime.hour
-        minute = birth_datetime.minute
-        
+            year, month, day, hour, minute = 1990, 1, 1, 12, 0
+
         # Get location info
-        city = chart_data.get('birth_city', 'London')
-        country = chart_data.get('birth_country', 'GB')
-        
+        city = chart_data.get('birth_city') or 'London'
+        country = chart_data.get('birth_country') or default_country
+
         # Handle country code formatting
         if len(country) > 2:
             # Convert full country names to country codes
-            country_mapping = {
-                'United States': 'US',
-                'United Kingdom': 'GB', 
-                'Canada': 'CA',
-                'Australia': 'AU',
-                'Germany': 'DE',
-                'France': 'FR',
-                'Italy': 'IT',
-                'Spain': 'ES',
-                'Netherlands': 'NL',
-                'Belgium': 'BE',
-                'Switzerland': 'CH',
-                'Austria': 'AT',
-                'Japan': 'JP',
-                'China': 'CN',
-                'India': 'IN',
-                'Brazil': 'BR',
-                'Mexico': 'MX',
-                'Argentina': 'AR',
-                'Russia': 'RU',
-                'Norway': 'NO',
-                'Sweden': 'SE',
-                'Denmark': 'DK',
-                'Finland': 'FI'
-            }
-            country = country_mapping.get(country, 'GB')
-        
-        # Create AstrologicalSubject
+            country = _COUNTRY_TO_ISO.get(country, default_country)
+
+        # Create AstrologicalSubject, bypassing the geonames lookup when the
+        # location has been resolved before
+        geo = _GEO_CACHE.get((city, country))
+        if geo is not None:
+            lng, lat, tz_str = geo
+            return AstrologicalSubject(
+                name=chart_data.get('name', 'Chart'),
+                year=year,
+                month=month,
+                day=day,
+                hour=hour,
+                minute=minute,
+                city=city,
+                nation=country,
+                lng=lng,
+                lat=lat,
+                tz_str=tz_str,
+                online=False
+            )
+
         subject = AstrologicalSubject(
             name=chart_data.get('name', 'Chart'),
-            year=birth_datetime.year,
-            month=birth_datetime.month,
-            day=birth_datetime.day,
+            year=year,
+            month=month,
+            day=day,
             hour=hour,
             minute=minute,
             city=city,
             nation=country
         )
-        
+
+        # Remember the resolved coordinates for subsequent charts
+        try:
+            _GEO_CACHE[(city, country)] = (subject.lng, subject.lat, subject.tz_str)
+        except AttributeError:
+            pass
+
         return subject
     
     def _get_chart_width(self, size: str) -> int:
@@ -290,31 +502,33 @@ class DynamicNatalGenerator:
         Optimize SVG for Discord display - clean circular chart only.
         """
         try:
-            # Ensure proper SVG namespace
-            if 'xmlns="http://www.w3.org/2000/svg"' not in svg_content:
+            # Both attributes, if present, live in the opening <svg> tag, so
+            # only the head of the document needs scanning - not all 40+ KB
+            head = svg_content[:512]
+
+            # Ensure proper SVG namespace (regardless of quote style)
+            if 'xmlns=' not in head:
                 svg_content = svg_content.replace(
-                    '<svg', 
-                    '<svg xmlns="http://www.w3.org/2000/svg"', 
+                    '<svg',
+                    f'<svg {_SVG_XMLNS}',
                     1
                 )
-            
+
             # Add viewBox if not present for proper scaling
-            if 'viewBox=' not in svg_content:
-                # Extract width and height if available
-                import re
-                width_match = re.search(r'width="(\d+)"', svg_content)
-                height_match = re.search(r'height="(\d+)"', svg_content)
-                
-                if width_match and height_match:
-                    width = width_match.group(1)
-                    height = height_match.group(1)
+            if 'viewBox=' not in head:
+                # Extract width and height in a single pass
+                wh_match = _WH_RE.search(svg_content)
+                if wh_match:
+                    width, height = wh_match.groups()
                     svg_content = svg_content.replace(
                         '<svg',
                         f'<svg viewBox="0 0 {width} {height}"',
                         1
                     )
-            
-            return svg_content
+
+            # Final step: minify before returning so cached/served SVGs
+            # are already as small as they will get
+            return _minify_svg(svg_content)
             
         except Exception as e:
             print(f"Warning: SVG optimization failed: {e}", file=sys.stderr)
@@ -323,16 +537,11 @@ class DynamicNatalGenerator:
     def _generate_error_svg(self, error_message: str) -> str:
         """
         Generate a clean error SVG for display.
+
+        The message is XML-escaped so exception text containing <, & or
+        quotes cannot produce an invalid document.
         """
-        return f'''<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" viewBox="0 0 400 400">
-            <circle cx="200" cy="200" r="180" fill="none" stroke="#666" stroke-width="2"/>
-            <text x="200" y="180" text-anchor="middle" font-family="Arial, sans-serif" font-size="16" fill="#666">
-                Chart Generation Error
-            </text>
-            <text x="200" y="220" text-anchor="middle" font-family="Arial, sans-serif" font-size="12" fill="#999">
-                {error_message[:50]}
-            </text>
-        </svg>'''
+        return _ERROR_SVG_TMPL % _xml_escape(error_message[:50])
 
     def _generate_synastry_chart(self, chart_input: Dict[str, Any]) -> str:
         """
@@ -345,165 +554,48 @@ class DynamicNatalGenerator:
             
             if not primary_chart or not synastry_chart:
                 return self._generate_error_svg("Missing synastry chart data")
-            
-            # Create first AstrologicalSubject
-            first = self._create_astrological_subject_from_chart_data(primary_chart)
-            
-            # Create second AstrologicalSubject
-            second = self._create_astrological_subject_from_chart_data(synastry_chart)
-            
-            # Create synastry chart using Kerykeion's synastry functionality
-            synastry_chart_svg = KerykeionChartSVG(first, "Synastry", second)
-            
-            # Generate wheel-only synastry SVG
-            # Set up working directory for file generation
-            import glob
-            import os
-            original_cwd = os.getcwd()
-            
-            # Use /tmp directory directly (most permissive)
-            os.chdir("/tmp")
-            
-            try:
-                synastry_chart_svg.makeWheelOnlySVG()
-                
-                # Find the generated SVG file in both /tmp and current directory
-                svg_files = []
-                svg_files.extend(glob.glob(os.path.join("/tmp", "*.svg")))
-                svg_files.extend(glob.glob(os.path.join(os.getcwd(), "*.svg")))
-                
-                if svg_files:
-                    # Read the most recently created SVG file
-                    svg_file = max(svg_files, key=os.path.getctime)
-                    with open(svg_file, 'r') as f:
-                        svg_content = f.read()
-                    
-                    # Clean up the file
-                    os.remove(svg_file)
-                    
-                    # Post-process for Discord display
-                    options = chart_input.get('options', {})
-                    return self._optimize_for_discord(svg_content, {}, options)
-                else:
-                    return self._generate_error_svg("Kerykeion failed to generate synastry SVG file")
-            finally:
-                # Always restore original working directory
-                os.chdir(original_cwd)
-                
+
+            options = chart_input.get('options', {})
+
+            # Cache key is the pair of per-chart subhashes, so the same couple
+            # of charts short-circuits regardless of request framing
+            cache_key = (_canonical_key(primary_chart), _canonical_key(synastry_chart))
+            return self._render_synastry_svg(
+                cache_key,
+                json.dumps(primary_chart, sort_keys=True, default=str),
+                json.dumps(synastry_chart, sort_keys=True, default=str),
+                json.dumps(options, sort_keys=True, default=str)
+            )
+
         except Exception as e:
             print(f"Synastry generation error: {e}", file=sys.stderr)
             import traceback
             traceback.print_exc(file=sys.stderr)
             return self._generate_error_svg(f"Synastry generation failed: {str(e)}")
 
-    def _create_astrological_subject_from_chart_data(self, chart_data: Dict[str, Any]) -> Any:
+    @functools.lru_cache(maxsize=1024)
+    def _render_synastry_svg(self, cache_key: Tuple[str, str], frozen_primary: str,
+                             frozen_synastry: str, frozen_options: str) -> str:
         """
-        Create AstrologicalSubject from chart data dictionary.
+        Render a synastry chart SVG, memoized on the pair of chart subhashes.
         """
-        # Parse birth date
-        birth_date_str = chart_data.get('birth_date')
-        if isinstance(birth_date_str, str):
-            birth_datetime = datetime.fromisoformat(birth_date_str.replace('Z', '+00:00'))
-        else:
-            birth_datetime = datetime.now()
-        
-        # Parse birth time
-        time_str = chart_data.get('birth_time', '12:00')
-        time_parts = time_str.split(':')
-        hour = int(time_parts[0]) if len(time_parts) > 0 else 12
-        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-        
-        # Get location data
-        city = chart_data.get('birth_city', 'Unknown')
-        country = chart_data.get('birth_country', 'US')
-        
-        # Map country names to ISO codes
-        country_code = self._map_country_to_code(country)
-        
-        name = chart_data.get('name', 'Person')
-        
-        return AstrologicalSubject(
-            name=name,
-            year=birth_datetime.year,
-            month=birth_datetime.month,
-            day=birth_datetime.day,
-            hour=hour,
-            minute=minute,
-            city=city,
-            nation=country_code
-        )
+        primary_chart = json.loads(frozen_primary)
+        synastry_chart = json.loads(frozen_synastry)
+        options = json.loads(frozen_options)
 
-    def _map_country_to_code(self, country: str) -> str:
-        """
-        Map country names to ISO country codes for Kerykeion.
-        """
-        if not country or len(country) <= 2:
-            return country or 'US'
-        
-        country_mapping = {
-            'United States': 'US',
-            'United Kingdom': 'GB', 
-            'Canada': 'CA',
-            'Australia': 'AU',
-            'Germany': 'DE',
-            'France': 'FR',
-            'Italy': 'IT',
-            'Spain': 'ES',
-            'Netherlands': 'NL',
-            'Belgium': 'BE',
-            'Switzerland': 'CH',
-            'Austria': 'AT',
-            'Japan': 'JP',
-            'China': 'CN',
-            'India': 'IN',
-            'Brazil': 'BR',
-            'Mexico': 'MX',
-            'Argentina': 'AR',
-            'Russia': 'RU',
-            'Norway': 'NO',
-            'Sweden': 'SE',
-            'Denmark': 'DK',
-            'Finland': 'FI',
-            'Poland': 'PL',
-            'Czech Republic': 'CZ',
-            'Hungary': 'HU',
-            'Ireland': 'IE',
-            'Portugal': 'PT',
-            'Greece': 'GR',
-            'Turkey': 'TR',
-            'Israel': 'IL',
-            'Egypt': 'EG',
-            'South Africa': 'ZA',
-            'New Zealand': 'NZ',
-            'South Korea': 'KR',
-            'Thailand': 'TH',
-            'Singapore': 'SG',
-            'Philippines': 'PH',
-            'Malaysia': 'MY',
-            'Indonesia': 'ID',
-            'Vietnam': 'VN',
-            'Chile': 'CL',
-            'Colombia': 'CO',
-            'Peru': 'PE',
-            'Venezuela': 'VE',
-            'Ukraine': 'UA',
-            'Romania': 'RO',
-            'Bulgaria': 'BG',
-            'Croatia': 'HR',
-            'Serbia': 'RS',
-            'Slovenia': 'SI',
-            'Slovakia': 'SK',
-            'Lithuania': 'LT',
-            'Latvia': 'LV',
-            'Estonia': 'EE',
-            'Iceland': 'IS',
-            'Luxembourg': 'LU',
-            'Malta': 'MT',
-            'Cyprus': 'CY'
-        }
-        
-        return country_mapping.get(country, 'US')
+        # Create both AstrologicalSubjects
+        first = self._build_subject(primary_chart, default_country='US')
+        second = self._build_subject(synastry_chart, default_country='US')
 
+        # Generate wheel-only synastry SVG into a per-request temporary directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            synastry_chart_svg = KerykeionChartSVG(
+                first, "Synastry", second, new_output_directory=temp_dir
+            )
+            svg_content = self._render_wheel_svg(synastry_chart_svg, temp_dir)
+
+        # Post-process for Discord display
+        return self._optimize_for_discord(svg_content, {}, options)
 
 def main():
     """
@@ -525,12 +617,7 @@ def main():
     except Exception as e:
         print(f"Fatal error in main: {e}", file=sys.stderr)
         # Output fallback SVG
-        print('''<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" viewBox="0 0 400 400">
-            <circle cx="200" cy="200" r="180" fill="none" stroke="#ff4444" stroke-width="3"/>
-            <text x="200" y="200" text-anchor="middle" font-family="Arial, sans-serif" font-size="18" fill="#ff4444">
-                Chart System Error
-            </text>
-        </svg>''')
+        print(_FATAL_SVG)
         sys.exit(1)
 
 
@@ -25,64 +25,253 @@ Features:
 - Supports synastry charts when synastry_data is provided.
 """
 
-import json
+import atexit
+import contextlib
+import functools
+import inspect
+import logging
 import os
+import re
+import shutil
 import sys
 import tempfile
+import threading
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+from kerykeion import AstrologicalSubject, KerykeionChartSVG
+
+# orjson's SIMD parser is several times faster than stdlib json and takes
+# bytes directly; fall back transparently when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Diagnostic chatter costs a stderr write per line on every chart; keep
+# it off unless explicitly requested. Formatting is deferred via %s args
+# so disabled-level calls cost one flag check.
+_DEBUG = os.environ.get('LUCY_CHART_DEBUG') == '1'
+_log = logging.getLogger(__name__)
+if _DEBUG:
+    # Nothing else configures this logger, so give it a stderr sink and
+    # drop its level - otherwise the records die at the default WARNING
+    # threshold and the flag would be a no-op
+    _log.addHandler(logging.StreamHandler())
+    _log.setLevel(logging.DEBUG)
+
+# Kerykeion's render chatter is discarded; pointing the redirect at a real
+# /dev/null fd lets the OS drop the writes instead of accumulating every
+# byte in a StringIO that is thrown away per chart. Swapping sys.stdout/
+# sys.stderr is process-global, and the service runs renders concurrently
+# on a thread pool, so the swap is refcounted under a lock: the first
+# render in saves the real streams, the last one out restores them.
+# Interleaved exits can therefore never strand the process on devnull.
+_devnull = open(os.devnull, 'w')
+_silence_lock = threading.Lock()
+_silence_depth = 0
+_saved_streams = None
+
+
+@contextlib.contextmanager
+def _silence_output():
+    """Thread-safe stdout/stderr silencing around a render call."""
+    global _silence_depth, _saved_streams
+    with _silence_lock:
+        if _silence_depth == 0:
+            _saved_streams = (sys.stdout, sys.stderr)
+            sys.stdout = sys.stderr = _devnull
+        _silence_depth += 1
+    try:
+        yield
+    finally:
+        with _silence_lock:
+            _silence_depth -= 1
+            if _silence_depth == 0:
+                sys.stdout, sys.stderr = _saved_streams
+                _saved_streams = None
+
+# Per-process scratch root for Kerykeion's file output, created once and
+# cleaned up at interpreter exit. Each render gets a private subdirectory
+# under it (one mkdir) instead of a full TemporaryDirectory whose exit
+# runs a recursive rmtree walk per chart.
+_SCRATCH_DIR = tempfile.mkdtemp(prefix='lucy-chart-')
+atexit.register(shutil.rmtree, _SCRATCH_DIR, ignore_errors=True)
+
+# Fallback SVG for the CLI error path, encoded once at import; only the
+# truncated error message is spliced in when something goes wrong
+_ERROR_SVG_TMPL = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400">'
+    '<circle cx="200" cy="200" r="180" fill="none" stroke="#666" stroke-width="2"/>'
+    '<text x="200" y="180" text-anchor="middle" font-family="Arial"'
+    ' font-size="16" fill="#666">Chart Generation Error</text>'
+    '<text x="200" y="220" text-anchor="middle" font-family="Arial"'
+    ' font-size="12" fill="#999">{msg}</text>'
+    '</svg>'
+).encode('utf-8')
+
+# House/cusp-drawing method names on KerykeionChartSVG, resolved once at
+# import; _noop stands in for them whenever house drawing is suppressed
+_HOUSE_METHOD_NAMES = tuple(
+    name for name in dir(KerykeionChartSVG)
+    if any(word in name.lower() for word in ('house', 'cusp', 'division'))
+    and callable(getattr(KerykeionChartSVG, name, None))
+)
+
+def _noop(self, *args, **kwargs):
+    return None
+
+# Whether this Kerykeion's makeWheelOnlySVG takes remove_css_variables,
+# probed once at import so the render call is a plain if/else rather
+# than a try/except TypeError frame unwind on every chart
+try:
+    _WHEEL_ACCEPTS_CSS_ARG = 'remove_css_variables' in inspect.signature(
+        KerykeionChartSVG.makeWheelOnlySVG
+    ).parameters
+except (TypeError, ValueError):
+    _WHEEL_ACCEPTS_CSS_ARG = False
+
+# House numbers as one alternation: arabic 1-12 (1[0-2]? covers 1 and
+# 10-12, [2-9] the rest) and Roman I-XII (I II III | IV | V-VIII | IX |
+# X XI XII), matching those values exactly - 13, IIII, XIII etc. stay
+_HOUSE_NUM_PAT = rb'1[0-2]?|[2-9]|I{1,3}|IV|VI{0,3}|IX|XI{0,2}'
+
+# Cheap substring probes deciding whether an emitted transit SVG still
+# carries house markup: the kr:node markers and Houses_Wheel wrapper
+# group kerykeion 4.26 writes, plus the legacy id/class spellings older
+# versions used. 4.26's templates single-quote their attributes, so each
+# quoted marker appears in both quote styles.
+_HOUSE_MARKERS = (
+    b"kr:node='Cusp'",
+    b'kr:node="Cusp"',
+    b"kr:node='HouseNumber'",
+    b'kr:node="HouseNumber"',
+    b'Houses_Wheel',
+    b"id='houses'",
+    b'id="houses"',
+    b"class='house",
+    b'class="house',
+)
+
+# A <g> body with no nested group: anything up to </g> that never opens
+# another <g>. Matching only such leaf groups keeps the substitution from
+# eating one inner </g> of a wrapper (like 4.26's Houses_Wheel) and
+# leaving the document with unbalanced tags - wrappers are left in place,
+# emptied of their house children.
+_LEAF_G_BODY = rb'(?:(?!<g[\s>]).)*?</g>'
+
+# Everything house-shaped that may survive in an emitted transit SVG,
+# fused into one alternation so stripping is a single pass over the
+# bytes: kerykeion 4.26's kr:node-marked cusp/number groups, legacy
+# id/class-marked groups, thin or gray division <line>s (attribute or
+# inline-style form), house-marked paths/circles, and <text> house
+# numbers (bare or tspan-wrapped). Attribute values accept either quote
+# style - 4.26's templates single-quote, older markup double-quotes.
+_HOUSE_STRIP_RE = re.compile(
+    rb'(?is)<g[^>]*kr:node=["\'](?:Cusp|HouseNumber)["\'][^>]*>' + _LEAF_G_BODY
+    + rb'|<g[^>]*(?:id=["\']houses["\']|class=["\'][^"\']*house)[^>]*>' + _LEAF_G_BODY
+    + rb'|<line[^>]*(?:stroke-width=["\'](?:0\.5|1|2)["\']'
+    rb'|stroke-width:\s*(?:0\.5|1|2)px'
+    rb'|stroke=["\'](?:#(?:666|777|888|999|aaa|bbb|ccc)|gr[ae]y)["\'])[^>]*/?>'
+    rb'|<(?:path|circle)[^>]*house[^>]*>'
+    rb'|<text[^>]*>\s*(?:<tspan[^>]*>\s*(?:' + _HOUSE_NUM_PAT + rb')\s*</tspan>'
+    rb'|(?:' + _HOUSE_NUM_PAT + rb'))\s*</text>'
+)
+
+# Optional attributes Kerykeion versions have hung house data off of,
+# paired with the empty container each resets to for transit charts
+_HOUSE_ATTRS = (
+    ('cusps', list),
+    ('house_cusps', list),
+    ('house_cusps_list', list),
+    ('houses', dict),
+    ('_houses', dict),
+    ('_house_cusps', list),
+    ('_cusps', list),
+    ('house_positions', list),
+)
+
+def _wipe_house_data(obj):
+    """Blank every house-related attribute on a subject so the chart
+    drawer has nothing to render."""
+    obj.houses_list = []
+    obj.houses_dict = {}
+    for name, ctor in _HOUSE_ATTRS:
+        if hasattr(obj, name):
+            setattr(obj, name, ctor())
+
+# Country name -> ISO code mapping, keys casefolded once at import so the
+# per-chart lookup is a single dict get with no dict rebuild. ISO codes map
+# to themselves so two-letter inputs resolve through the same path.
+_COUNTRY_MAP = {k.casefold(): v for k, v in {
+    'United States': 'US', 'USA': 'US',
+    'United Kingdom': 'GB', 'UK': 'GB',
+    'Canada': 'CA', 'Australia': 'AU',
+    'Germany': 'DE', 'France': 'FR', 'Italy': 'IT',
+    'Spain': 'ES', 'Netherlands': 'NL', 'Belgium': 'BE',
+    'Switzerland': 'CH', 'Austria': 'AT', 'Japan': 'JP',
+    'China': 'CN', 'India': 'IN', 'Brazil': 'BR', 'Mexico': 'MX',
+    'Argentina': 'AR', 'Russia': 'RU', 'Norway': 'NO',
+    'Sweden': 'SE', 'Denmark': 'DK', 'Finland': 'FI',
+    'Poland': 'PL', 'Czech Republic': 'CZ', 'Hungary': 'HU',
+    'Ireland': 'IE', 'Portugal': 'PT', 'Greece': 'GR',
+    'Turkey': 'TR', 'Israel': 'IL', 'Egypt': 'EG',
+    'South Africa': 'ZA', 'New Zealand': 'NZ',
+    'South Korea': 'KR', 'Thailand': 'TH', 'Singapore': 'SG',
+    'Philippines': 'PH', 'Malaysia': 'MY', 'Indonesia': 'ID',
+    'Vietnam': 'VN', 'Chile': 'CL', 'Colombia': 'CO',
+    'Peru': 'PE', 'Venezuela': 'VE', 'Ukraine': 'UA',
+    'Romania': 'RO', 'Bulgaria': 'BG', 'Croatia': 'HR',
+    'Serbia': 'RS', 'Slovenia': 'SI', 'Slovakia': 'SK',
+    'Lithuania': 'LT', 'Latvia': 'LV', 'Estonia': 'EE',
+    'Iceland': 'IS', 'Luxembourg': 'LU', 'Malta': 'MT',
+    'Cyprus': 'CY'
+}.items()}
+_COUNTRY_MAP.update({code.casefold(): code for code in set(_COUNTRY_MAP.values())})
 
 
 def map_country_to_code(country: str) -> str:
     """Map country names to ISO country codes for Kerykeion."""
-    if not country or len(country) <= 2:
-        return country or 'US'
-    
-    country_mapping = {
-        'United States': 'US', 'USA': 'US',
-        'United Kingdom': 'GB', 'UK': 'GB',
-        'Canada': 'CA', 'Australia': 'AU',
-        'Germany': 'DE', 'France': 'FR', 'Italy': 'IT',
-        'Spain': 'ES', 'Netherlands': 'NL', 'Belgium': 'BE',
-        'Switzerland': 'CH', 'Austria': 'AT', 'Japan': 'JP',
-        'China': 'CN', 'India': 'IN', 'Brazil': 'BR', 'Mexico': 'MX',
-        'Argentina': 'AR', 'Russia': 'RU', 'Norway': 'NO',
-        'Sweden': 'SE', 'Denmark': 'DK', 'Finland': 'FI',
-        'Poland': 'PL', 'Czech Republic': 'CZ', 'Hungary': 'HU',
-        'Ireland': 'IE', 'Portugal': 'PT', 'Greece': 'GR',
-        'Turkey': 'TR', 'Israel': 'IL', 'Egypt': 'EG',
-        'South Africa': 'ZA', 'New Zealand': 'NZ',
-        'South Korea': 'KR', 'Thailand': 'TH', 'Singapore': 'SG',
-        'Philippines': 'PH', 'Malaysia': 'MY', 'Indonesia': 'ID',
-        'Vietnam': 'VN', 'Chile': 'CL', 'Colombia': 'CO',
-        'Peru': 'PE', 'Venezuela': 'VE', 'Ukraine': 'UA',
-        'Romania': 'RO', 'Bulgaria': 'BG', 'Croatia': 'HR',
-        'Serbia': 'RS', 'Slovenia': 'SI', 'Slovakia': 'SK',
-        'Lithuania': 'LT', 'Latvia': 'LV', 'Estonia': 'EE',
-        'Iceland': 'IS', 'Luxembourg': 'LU', 'Malta': 'MT',
-        'Cyprus': 'CY'
-    }
-    return country_mapping.get(country, 'US')
+    if not country:
+        return 'US'
+    code = _COUNTRY_MAP.get(country.casefold())
+    if code is not None:
+        return code
+    # Unrecognized two-letter codes pass through unchanged, as before
+    return country if len(country) <= 2 else 'US'
+
+
+def _parse_iso_date(date_str: str) -> Tuple[int, int, int]:
+    """Slice YYYY-MM-DD (optionally with a time suffix) straight to ints.
+
+    Only the three date fields are needed downstream, so the common case
+    skips datetime construction entirely; odd inputs fall back to the
+    datetime parsers and raise ValueError as before.
+    """
+    try:
+        return int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+    except ValueError:
+        if 'T' in date_str:
+            birth_datetime = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        else:
+            birth_datetime = datetime.strptime(date_str, '%Y-%m-%d')
+        return birth_datetime.year, birth_datetime.month, birth_datetime.day
 
 
 def parse_birth_data(chart_data: Dict[str, Any]) -> Dict[str, Any]:
     """Parse birth data into Kerykeion format."""
     birth_date_str = chart_data.get('birth_date')
     if isinstance(birth_date_str, str):
-        if 'T' in birth_date_str:
-            birth_datetime = datetime.fromisoformat(birth_date_str.replace('Z', '+00:00'))
-        else:
-            birth_datetime = datetime.strptime(birth_date_str, '%Y-%m-%d')
+        year, month, day = _parse_iso_date(birth_date_str)
     else:
         raise ValueError(f"Invalid birth_date format: {birth_date_str}")
-    
+
     birth_time_str = chart_data.get('birth_time', '12:00:00')
     if isinstance(birth_time_str, str):
-        if len(birth_time_str) == 5:  # HH:MM
-            hour, minute = map(int, birth_time_str.split(':'))
-        elif len(birth_time_str) == 8:  # HH:MM:SS
-            hour, minute = map(int, birth_time_str.split(':')[:2])
-        else:
+        try:
+            hour_str, minute_str = birth_time_str.split(':', 2)[:2]
+            hour, minute = int(hour_str), int(minute_str)
+        except ValueError:
             hour, minute = 12, 0
     else:
         hour, minute = 12, 0
@@ -93,9 +282,9 @@ def parse_birth_data(chart_data: Dict[str, Any]) -> Dict[str, Any]:
 
     return {
         'name': chart_data.get('name', 'Chart'),
-        'year': birth_datetime.year,
-        'month': birth_datetime.month,
-        'day': birth_datetime.day,
+        'year': year,
+        'month': month,
+        'day': day,
         'hour': hour,
         'minute': minute,
         'city': city,
@@ -132,106 +321,152 @@ def get_active_points(rulership: str, is_transit: bool = False) -> list:
         return planets + angles
 
 
-def generate_chart(input_data: Dict[str, Any]) -> str:
-    """Generate wheel-only SVG chart using Kerykeion with Chiron and Lilith disabled."""
-    from kerykeion import AstrologicalSubject, KerykeionChartSVG, KrInstance
-    
-    # Check if this is a transit/date-only chart
-    is_transit = input_data.get('is_transit', False)
-    original_methods = {}
-    
-    # If it's a transit chart, monkeypatch KerykeionChartSVG to disable house drawing
-    if is_transit:
-        # Save and replace ALL methods that might draw houses
-        for method_name in dir(KerykeionChartSVG):
-            if any(word in method_name.lower() for word in ['house', 'cusp', 'division']):
-                if hasattr(KerykeionChartSVG, method_name) and callable(getattr(KerykeionChartSVG, method_name)):
-                    original_methods[method_name] = getattr(KerykeionChartSVG, method_name)
-                    setattr(KerykeionChartSVG, method_name, lambda self, *a, **k: None)
-        
-        import logging
-        logging.warning(f"TRANSIT DEBUG: Monkeypatched {len(original_methods)} methods: {list(original_methods.keys())}")
-        print(f"TRANSIT DEBUG: About to monkeypatch for transit chart")  # Try stdout too
-    
-    # Create a custom AstrologicalSubject that doesn't calculate houses for transits
-    class TransitSubject(AstrologicalSubject):
-        """Custom AstrologicalSubject that skips house calculations for transit charts."""
-        
-        def __init__(self, *args, **kwargs):
-            self._is_transit = kwargs.pop('_is_transit', False)
-            super().__init__(*args, **kwargs)
-            
-        def houses(self):
-            """Override houses method to return empty dict for transit charts."""
-            if self._is_transit:
-                return {}
-            else:
-                return super().houses()
-        
-        def _calculate_houses(self):
-            """Override house calculation for transit charts."""
-            if self._is_transit:
-                # Skip house calculations entirely - just return empty dict
-                self.houses_list = []
-                return {}
-            else:
-                return super()._calculate_houses()
-    
-    # Create a custom KerykeionChartSVG that doesn't draw houses for transit charts
-    class NoHousesChartSVG(KerykeionChartSVG):
-        """Custom chart SVG that completely skips house drawing for transit/date-only charts."""
-        
-        def __init__(self, *args, **kwargs):
-            self._skip_houses = kwargs.pop('_skip_houses', False)
-            super().__init__(*args, **kwargs)
-            
-            # If skipping houses, override ALL possible drawing methods dynamically
-            if self._skip_houses:
-                # Get all methods that might draw houses
-                for method_name in dir(self):
-                    if any(word in method_name.lower() for word in ['house', 'cusp', 'division']) and callable(getattr(self, method_name)):
-                        # Create a no-op function for this method
-                        setattr(self, method_name, lambda *a, **k: None)
-        
-        def makeWheelOnlySVG(self, *args, **kwargs):
-            """Override the main method to prevent any house drawing."""
-            if self._skip_houses:
-                # Clear houses from all subjects before generating
-                for attr in ['first_subject', 'subject', 'user']:
-                    if hasattr(self, attr):
-                        subj = getattr(self, attr)
-                        if subj:
-                            subj.houses_list = []
-                            subj.houses_dict = {}
-                            if hasattr(subj, 'cusps'):
-                                subj.cusps = []
-            
-            # Call parent method
-            return super().makeWheelOnlySVG(*args, **kwargs)
+class TransitSubject(AstrologicalSubject):
+    """Custom AstrologicalSubject that skips house calculations for transit charts."""
+
+    def __init__(self, *args, **kwargs):
+        self._is_transit = kwargs.pop('_is_transit', False)
+        super().__init__(*args, **kwargs)
+
+    def houses(self):
+        """Override houses method to return empty dict for transit charts."""
+        if self._is_transit:
+            return {}
+        else:
+            return super().houses()
+
+    def _calculate_houses(self):
+        """Override house calculation for transit charts."""
+        if self._is_transit:
+            # Skip house calculations entirely - just return empty dict
+            self.houses_list = []
+            return {}
+        else:
+            return super()._calculate_houses()
+
+
+class NoHousesChartSVG(KerykeionChartSVG):
+    """Chart SVG subclass whose house-drawing methods are all no-ops.
+
+    The overrides are installed on the class once at import (just below),
+    so constructing an instance is a plain KerykeionChartSVG.__init__ -
+    no per-instance dir() scan or setattr loop - and suppressed methods
+    dispatch through ordinary MRO lookup.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Accepted for call-site compatibility; suppression is now
+        # unconditional at class level
+        kwargs.pop('_skip_houses', None)
+        super().__init__(*args, **kwargs)
+
+    def makeWheelOnlySVG(self, *args, **kwargs):
+        """Clear house data from attached subjects, then render."""
+        for attr in ('first_subject', 'subject', 'user'):
+            subj = getattr(self, attr, None)
+            if subj is not None:
+                _wipe_house_data(subj)
+        return super().makeWheelOnlySVG(*args, **kwargs)
+
+
+# Shadow every house-drawing method with a no-op, once, at class level.
+# On kerykeion versions where house drawing lives in module-level helpers
+# (4.26 among them) the name scan finds nothing; the subclass then relies
+# on the wiped subject data and the SVG strip fallback instead.
+for _name in _HOUSE_METHOD_NAMES:
+    setattr(NoHousesChartSVG, _name, _noop)
+if _HOUSE_METHOD_NAMES:
+    del _name
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_subject(frozen_params) -> AstrologicalSubject:
+    """Construct (or reuse) an AstrologicalSubject for a frozen kwarg set.
+
+    Subject construction runs the full swisseph calculation; on synastry
+    workloads the same natal subject is paired with many different second
+    subjects, so identical birth params come straight from the cache.
+    Instances are treated as read-only after construction - TransitSubject
+    bypasses this cache because its house data gets wiped in place.
+    """
+    return AstrologicalSubject(**dict(frozen_params))
+
+
+def _get_subject(**params) -> AstrologicalSubject:
+    """Normalize subject kwargs into a hashable key and hit the cache."""
+    return _cached_subject(tuple(sorted(params.items())))
+
+
+def _make_common_params(info: Dict[str, Any], house_system: str, zodiac_type: str,
+                        sidereal_mode, name_suffix: str = "") -> Dict[str, Any]:
+    """Build the AstrologicalSubject keyword set shared by every branch.
+
+    One place constructs the nine common keys (plus optional sidereal
+    mode) instead of three hand-inlined copies in generate_chart.
+    """
+    params = {
+        'name': info['name'] + name_suffix,
+        'year': info['year'],
+        'month': info['month'],
+        'day': info['day'],
+        'hour': info['hour'],
+        'minute': info['minute'],
+        'houses_system_identifier': house_system,
+        'zodiac_type': zodiac_type,
+        'disable_chiron': True  # Disable Chiron calculations
+    }
+    if sidereal_mode:
+        params['sidereal_mode'] = sidereal_mode
+    return params
+
+
+def _read_generated_svg(temp_dir: str, subject_name: str, chart_type: str) -> bytes:
+    """Read the SVG Kerykeion just wrote without globbing the directory.
+
+    Kerykeion derives the output filename from the subject name and chart
+    type, so the known templates are tried directly; if neither matches
+    (naming changed across versions), one scandir pass over the fresh temp
+    dir finds the file without any per-entry stat calls. Returned as raw
+    bytes - the content goes straight back out over HTTP or stdout, so
+    there is no reason to decode and re-encode it.
+    """
+    for candidate in (
+        f"{subject_name} - {chart_type} Chart - Wheel Only.svg",
+        f"{subject_name} - {chart_type} Chart.svg",
+    ):
+        try:
+            with open(os.path.join(temp_dir, candidate), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".svg"):
+                with open(entry.path, "rb") as f:
+                    return f.read()
+    raise FileNotFoundError(f"No SVG file generated in {temp_dir}")
+
+
+def generate_chart(input_data: Dict[str, Any]) -> bytes:
+    """Generate wheel-only SVG chart (as UTF-8 bytes) using Kerykeion
+    with Chiron and Lilith disabled."""
+    # Destructure the request once; everything downstream reads locals
+    chart_data = input_data.get('chart_data') or {}
+    user_preferences = input_data.get('user_preferences') or {}
+    synastry_data = input_data.get('synastry_data')
+    is_transit = bool(input_data.get('is_transit'))
 
-    chart_data = input_data.get('chart_data', {})
     if not chart_data:
         raise ValueError("No chart_data provided")
-    
-    user_preferences = input_data.get('user_preferences', {})
-    synastry_data = input_data.get('synastry_data')
-    is_transit = input_data.get('is_transit', False)
-    
-    # Debug output
-    print(f"DEBUG: Chart generation starting - is_transit={is_transit}, name={chart_data.get('name', 'Unknown')}", file=sys.stderr)
-    
-    # DEBUG: Inspect KerykeionChartSVG methods when transit is requested
-    if is_transit:
-        house_methods = [m for m in dir(KerykeionChartSVG) if 'house' in m.lower()]
-        print(f"DEBUG: Methods with 'house': {house_methods}", file=sys.stderr)
-        
-        draw_methods = [m for m in dir(KerykeionChartSVG) if 'draw' in m.lower()]
-        print(f"DEBUG: Methods with 'draw': {draw_methods}", file=sys.stderr)
-        
-        # Look for the makeWheelOnlySVG method and try to see what it does
-        print(f"DEBUG: makeWheelOnlySVG exists: {hasattr(KerykeionChartSVG, 'makeWheelOnlySVG')}", file=sys.stderr)
-    
-    sys.stderr.flush()
+
+    if _DEBUG:
+        _log.debug("chart generation starting - is_transit=%s, name=%s",
+                   is_transit, chart_data.get('name', 'Unknown'))
+        if is_transit:
+            _log.debug("methods with 'house': %s",
+                       [m for m in dir(KerykeionChartSVG) if 'house' in m.lower()])
+            _log.debug("methods with 'draw': %s",
+                       [m for m in dir(KerykeionChartSVG) if 'draw' in m.lower()])
     birth_info = parse_birth_data(chart_data)
 
     latitude = chart_data.get('birth_latitude')
@@ -247,19 +482,8 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
     if zodiac == 'lahiri-vedic':
         zodiac_type, sidereal_mode = "Sidereal", "LAHIRI"
 
-    common_params = {
-        'name': birth_info['name'],
-        'year': birth_info['year'],
-        'month': birth_info['month'],
-        'day': birth_info['day'],
-        'hour': birth_info['hour'],
-        'minute': birth_info['minute'],
-        'houses_system_identifier': kerykeion_house_system,
-        'zodiac_type': zodiac_type,
-        'disable_chiron': True  # Disable Chiron calculations
-    }
-    if sidereal_mode:
-        common_params['sidereal_mode'] = sidereal_mode
+    common_params = _make_common_params(
+        birth_info, kerykeion_house_system, zodiac_type, sidereal_mode)
 
     if latitude and longitude and latitude != 0 and longitude != 0:
         if is_transit:
@@ -269,7 +493,7 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
                 city=birth_info['city'], _is_transit=True, **common_params
             )
         else:
-            first_subject = AstrologicalSubject(
+            first_subject = _get_subject(
                 lng=float(longitude), lat=float(latitude),
                 tz_str=timezone if timezone else "UTC",
                 city=birth_info['city'], **common_params
@@ -280,86 +504,63 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
                 city=birth_info['city'], nation=birth_info['nation'], _is_transit=True, **common_params
             )
         else:
-            first_subject = AstrologicalSubject(
+            first_subject = _get_subject(
                 city=birth_info['city'], nation=birth_info['nation'], **common_params
             )
 
     # Get active points based on rulership system
     active_points = get_active_points(rulership, is_transit)
     
-    # Wipe house data for transit/date-only charts so chart drawer has nothing to render  
+    # Wipe house data for transit/date-only charts so chart drawer has nothing to render
     if is_transit:
-        # Comprehensive house data wiping - this prevents houses from being drawn at all
-        first_subject.houses_list = []
-        first_subject.houses_dict = {}
-        
-        # Clear cusps which are used for house divisions
-        if hasattr(first_subject, "cusps"):
-            first_subject.cusps = []
-        if hasattr(first_subject, "house_cusps"):
-            first_subject.house_cusps = []
-        if hasattr(first_subject, "house_cusps_list"):
-            first_subject.house_cusps_list = []
-            
-        # Clear any other house-related attributes
-        if hasattr(first_subject, 'houses'):
-            first_subject.houses = {}
-        if hasattr(first_subject, '_houses'):
-            first_subject._houses = {}
-        if hasattr(first_subject, '_house_cusps'):
-            first_subject._house_cusps = []
-        if hasattr(first_subject, '_cusps'):
-            first_subject._cusps = []
-        if hasattr(first_subject, 'house_positions'):
-            first_subject.house_positions = []
-            
-        print(f"DEBUG: Wiped all house data for transit chart: {first_subject.name}", file=sys.stderr)
-        sys.stderr.flush()
+        _wipe_house_data(first_subject)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+        if _DEBUG:
+            _log.debug("wiped all house data for transit chart: %s", first_subject.name)
+
+    # Private subdir per render: Kerykeion derives filenames from the
+    # subject name, so concurrent renders of same-named subjects must
+    # not share an output directory
+    temp_dir = tempfile.mkdtemp(dir=_SCRATCH_DIR)
+    try:
         if synastry_data:
             # Check if this is a transit chart (synastry data with transit in name)
             is_transit_chart = (synastry_data.get('name', '').startswith('Transit ') or 
                                synastry_data.get('name', '').startswith('Transits '))
             
+            chart_type = "Transit" if is_transit_chart else "Synastry"
+
             # Parse synastry/transit data
             synastry_info = parse_birth_data(synastry_data)
             synastry_latitude = synastry_data.get('birth_latitude')
             synastry_longitude = synastry_data.get('birth_longitude')
             synastry_timezone = synastry_data.get('birth_timezone')
             
-            if is_transit_chart:
-                print(f"DEBUG: Creating transit chart - natal vs transits", file=sys.stderr)
-
-            synastry_params = {
-                'name': synastry_info['name'],
-                'year': synastry_info['year'],
-                'month': synastry_info['month'],
-                'day': synastry_info['day'],
-                'hour': synastry_info['hour'],
-                'minute': synastry_info['minute'],
-                'houses_system_identifier': kerykeion_house_system,
-                'zodiac_type': zodiac_type,
-                'disable_chiron': True
-            }
-            if sidereal_mode:
-                synastry_params['sidereal_mode'] = sidereal_mode
+            if is_transit_chart and _DEBUG:
+                _log.debug("creating transit chart - natal vs transits")
+
+            synastry_params = _make_common_params(
+                synastry_info, kerykeion_house_system, zodiac_type, sidereal_mode)
 
             if synastry_latitude and synastry_longitude and synastry_latitude != 0 and synastry_longitude != 0:
-                second_subject = AstrologicalSubject(
+                second_subject = _get_subject(
                     lng=float(synastry_longitude), lat=float(synastry_latitude),
                     tz_str=synastry_timezone if synastry_timezone else "UTC",
                     city=synastry_info['city'], **synastry_params
                 )
             else:
-                second_subject = AstrologicalSubject(
+                second_subject = _get_subject(
                     city=synastry_info['city'], nation=synastry_info['nation'], **synastry_params
                 )
 
             # Create synastry or transit chart using the correct Kerykeion format
             if is_transit_chart:
-                # Create transit chart (natal chart with transiting planets)
-                chart_svg = KerykeionChartSVG(
+                # Create transit chart (natal chart with transiting planets).
+                # House suppression lives on the subclass - no patching of
+                # KerykeionChartSVG itself, which other threads may be
+                # rendering with concurrently
+                chart_cls = NoHousesChartSVG if is_transit else KerykeionChartSVG
+                chart_svg = chart_cls(
                     first_subject,
                     "Transit", 
                     second_subject,
@@ -367,7 +568,8 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
                     theme="dark",
                     active_points=active_points
                 )
-                print(f"DEBUG: Created transit chart with natal vs transits", file=sys.stderr)
+                if _DEBUG:
+                    _log.debug("created transit chart with natal vs transits")
             elif is_transit:
                 # Legacy date-only transit (should not be used anymore)
                 chart_svg = NoHousesChartSVG(
@@ -392,49 +594,26 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
         elif is_transit:
             # Create pure transit chart - date only, no time or location needed
             # Use noon UTC at Greenwich for consistent planetary positions
-            transit_params = {
-                'name': birth_info['name'] + " (Transit)",
-                'year': birth_info['year'],
-                'month': birth_info['month'],
-                'day': birth_info['day'],
-                'hour': 12,  # Always noon for date-only transits
-                'minute': 0,  # Always :00 for date-only transits
-                'lng': 0.0,  # Greenwich longitude
-                'lat': 51.5,  # Greenwich latitude  
-                'tz_str': "UTC",  # Always UTC for pure transits
-                'city': "Greenwich",
-                'houses_system_identifier': 'P',  # Will be ignored for transit-only chart
-                'zodiac_type': zodiac_type,
-                'disable_chiron': True
+            chart_type = "Natal"
+            # House system is ignored for transit-only charts, hence 'P'
+            transit_params = _make_common_params(
+                birth_info, 'P', zodiac_type, sidereal_mode, name_suffix=" (Transit)")
+            # Noon UTC at Greenwich, regardless of the birth time/place
+            transit_params |= {
+                'hour': 12, 'minute': 0,
+                'lng': 0.0, 'lat': 51.5,
+                'tz_str': "UTC", 'city': "Greenwich",
             }
-            if sidereal_mode:
-                transit_params['sidereal_mode'] = sidereal_mode
                 
             transit_subject = TransitSubject(**transit_params, _is_transit=True)
-            
+            first_subject = transit_subject
+
             # Wipe house data so chart drawer has nothing to render
-            transit_subject.houses_list = []
-            transit_subject.houses_dict = {}
-            if hasattr(transit_subject, "cusps"):
-                transit_subject.cusps = []
-            if hasattr(transit_subject, "house_cusps"):
-                transit_subject.house_cusps = []
-            if hasattr(transit_subject, "house_cusps_list"):
-                transit_subject.house_cusps_list = []
-            if hasattr(transit_subject, 'houses'):
-                transit_subject.houses = {}
-            if hasattr(transit_subject, '_houses'):
-                transit_subject._houses = {}
-            if hasattr(transit_subject, '_house_cusps'):
-                transit_subject._house_cusps = []
-            if hasattr(transit_subject, '_cusps'):
-                transit_subject._cusps = []
-            if hasattr(transit_subject, 'house_positions'):
-                transit_subject.house_positions = []
-            
+            _wipe_house_data(transit_subject)
+
             # Log debug info for transit chart
-            print(f"DEBUG: Creating transit chart with active_points: {active_points}", file=sys.stderr)
-            print(f"DEBUG: Cleared all house data for transit chart", file=sys.stderr)
+            if _DEBUG:
+                _log.debug("creating transit chart with active_points: %s", active_points)
             
             # Create transit chart with planets only (no houses displayed)
             chart_svg = NoHousesChartSVG(
@@ -445,6 +624,7 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
                 _skip_houses=True
             )
         else:
+            chart_type = "Natal"
             # For regular charts (not transit), check if it's date-only
             if is_transit:
                 chart_svg = NoHousesChartSVG(
@@ -466,145 +646,111 @@ def generate_chart(input_data: Dict[str, Any]) -> str:
         if is_transit:
             # Clear houses from the subject(s) in the chart object
             if hasattr(chart_svg, 'first_subject'):
-                chart_svg.first_subject.houses_list = []
-                if hasattr(chart_svg.first_subject, 'houses'):
-                    chart_svg.first_subject.houses = {}
+                _wipe_house_data(chart_svg.first_subject)
             if hasattr(chart_svg, 'subject'):
-                chart_svg.subject.houses_list = []
-                if hasattr(chart_svg.subject, 'houses'):
-                    chart_svg.subject.houses = {}
+                _wipe_house_data(chart_svg.subject)
             # Clear any cached house data in the chart object itself
             if hasattr(chart_svg, 'houses_list'):
                 chart_svg.houses_list = []
             if hasattr(chart_svg, '_houses_list'):
                 chart_svg._houses_list = []
-            print(f"DEBUG: Cleared houses from chart_svg object before rendering", file=sys.stderr)
+            if _DEBUG:
+                _log.debug("cleared houses from chart_svg object before rendering")
         
-        import io, contextlib, glob
-        with io.StringIO() as buf, contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
-            try:
-                # Try with remove_css_variables
+        with _silence_output():
+            if _WHEEL_ACCEPTS_CSS_ARG:
+                # Inline CSS variables so the SVG renders outside browsers
                 chart_svg.makeWheelOnlySVG(remove_css_variables=True)
-            except TypeError:
+            else:
                 chart_svg.makeWheelOnlySVG()
 
-        # Locate the generated SVG file in temp_dir
-        svg_files = glob.glob(os.path.join(temp_dir, "*.svg"))
-        if not svg_files:
-            raise FileNotFoundError(f"No SVG file generated in {temp_dir}")
+        # Read the generated SVG by its expected name (scandir fallback)
+        svg_content = _read_generated_svg(temp_dir, first_subject.name, chart_type)
 
-        svg_file = max(svg_files, key=os.path.getctime)
-        with open(svg_file, "r", encoding="utf-8") as f:
-            svg_content = f.read()
-
-        if not svg_content or "<svg" not in svg_content:
+        if not svg_content or b"<svg" not in svg_content:
             raise ValueError("Generated SVG file is empty or invalid")
 
-        # Restore any monkeypatched methods if this was a transit chart
-        if is_transit and original_methods:
-            for method_name, original_method in original_methods.items():
-                setattr(KerykeionChartSVG, method_name, original_method)
-                
-        # As a final fallback, aggressively remove any remaining house-like elements from SVG
-        if is_transit:
+        # Upstream suppression is best-effort - on kerykeion 4.26 house
+        # drawing happens in module-level helpers that the subclass
+        # overrides cannot reach - so strip whenever the emitted SVG
+        # still carries house markup
+        if is_transit and any(marker in svg_content for marker in _HOUSE_MARKERS):
             svg_content = aggressive_house_removal(svg_content)
 
         return svg_content.strip()
-
-
-def aggressive_house_removal(svg_content: str) -> str:
-    """Aggressively remove any lines that could be house divisions."""
-    import re
-    
-    # Split SVG into lines for processing
-    lines = svg_content.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        # Skip lines that look like house division lines (straight lines from center)
-        # Common patterns: lines with stroke attributes that go from center to edge
-        if '<line' in line:
-            # Skip thin lines (likely house divisions)
-            if any(pattern in line for pattern in ['stroke-width="1"', 'stroke-width="0.5"', 'stroke-width="2"']):
-                continue
-            # Skip lines with gray/dark colors (common for house lines)
-            if any(color in line.lower() for color in ['#666', '#777', '#888', '#999', '#aaa', '#bbb', '#ccc', 'gray', 'grey']):
-                continue
-                
-        # Skip text elements with house numbers (1-12 or Roman numerals)
-        if '<text' in line:
-            if any(f'>{num}<' in line for num in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12']):
-                continue
-            if any(f'>{roman}<' in line for roman in ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII']):
-                continue
-                
-        # Keep all other lines
-        cleaned_lines.append(line)
-    
-    return '\n'.join(cleaned_lines)
-
-
-def remove_house_elements_from_svg(svg_content: str) -> str:
-    """Remove house lines and house numbers from SVG content."""
-    import re
-    
-    # First, try to remove entire house groups if they exist
-    svg_content = re.sub(r'<g[^>]*id="houses"[^>]*>.*?</g>', '', svg_content, flags=re.IGNORECASE | re.DOTALL)
-    svg_content = re.sub(r'<g[^>]*houses[^>]*>.*?</g>', '', svg_content, flags=re.IGNORECASE | re.DOTALL)
-    
-    # Remove house cusp lines (lines that radiate from center)
-    # More general pattern that works with any chart center coordinates
-    svg_content = re.sub(r'<line[^>]*(x1|y1)="[0-9]+"[^>]*>', '', svg_content)
-    svg_content = re.sub(r'<line[^>]*stroke[^>]*(x1|y1)="[0-9]+"[^>]*>', '', svg_content)
-    
-    # Remove house numbers (text elements with numbers 1-12)
-    for house_num in range(1, 13):
-        # Match various text element patterns for house numbers
-        svg_content = re.sub(f'<text[^>]*>\\s*{house_num}\\s*</text>', '', svg_content)
-        svg_content = re.sub(f'<text[^>]*font[^>]*>\\s*{house_num}\\s*</text>', '', svg_content)
-        # Roman numerals too (I, II, III, etc.)
-        roman_numerals = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII']
-        if house_num <= len(roman_numerals):
-            roman = roman_numerals[house_num - 1]
-            svg_content = re.sub(f'<text[^>]*>\\s*{roman}\\s*</text>', '', svg_content)
-    
-    # Remove any paths or elements with "house" in class or id
-    svg_content = re.sub(r'<path[^>]*house[^>]*>', '', svg_content, flags=re.IGNORECASE)
-    svg_content = re.sub(r'<circle[^>]*house[^>]*>', '', svg_content, flags=re.IGNORECASE)
-    
-    # Remove thin lines that typically represent house divisions
-    # These often have stroke-width="1" or similar thin strokes
-    svg_content = re.sub(r'<line[^>]*stroke-width="[0-2]"[^>]*>', '', svg_content)
-    
-    # Remove any remaining house division elements by common stroke colors
-    # House lines are often gray or dark colors
-    svg_content = re.sub(r'<line[^>]*stroke="#(?:666|777|888|999|aaa|bbb|ccc)"[^>]*>', '', svg_content, flags=re.IGNORECASE)
-    
-    return svg_content
+    finally:
+        # Drop the emitted file(s) and the subdir; two syscalls in the
+        # usual one-file case, best-effort on teardown races
+        try:
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(temp_dir)
+        except OSError:
+            pass
+
+
+def aggressive_house_removal(svg_content: bytes) -> bytes:
+    """Strip leftover house groups, division lines, and house numbers
+    from an emitted SVG in a single fused-alternation pass."""
+    return _HOUSE_STRIP_RE.sub(b'', svg_content)
+
+
+def _serve_forever():
+    """Long-running worker loop: one NDJSON request per stdin line, one
+    length-prefixed SVG frame (4-byte big-endian length, then the bytes)
+    per response on stdout.
+
+    Amortizes interpreter startup and the kerykeion/swisseph import over
+    every chart in the stream - the ephemeris tables load once and stay
+    resident - where the one-shot mode pays it per chart. Failures emit
+    the fallback error SVG as a normal frame so callers never desync.
+    """
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    while True:
+        line = stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            svg_content = generate_chart(_json_loads(line))
+        except Exception as e:
+            import traceback
+            traceback.print_exc(file=sys.stderr)
+            sys.stderr.flush()
+            svg_content = _ERROR_SVG_TMPL.replace(
+                b'{msg}', str(e)[:50].encode('ascii', 'replace'))
+        stdout.write(len(svg_content).to_bytes(4, 'big'))
+        stdout.write(svg_content)
+        stdout.flush()
 
 
 def main():
+    # Persistent worker mode; the default remains one chart per process
+    if '--server' in sys.argv[1:]:
+        _serve_forever()
+        return
+
     try:
-        input_data = json.loads(sys.stdin.read())
+        # Read bytes so orjson can skip the str decode/re-encode round-trip
+        input_data = _json_loads(sys.stdin.buffer.read())
         svg_content = generate_chart(input_data)
-        print(svg_content)  # Only clean SVG to stdout
-        sys.stdout.flush()
+        # Only clean SVG to stdout, written as bytes - no encode pass
+        sys.stdout.buffer.write(svg_content)
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
     except Exception as e:
         import traceback
         traceback.print_exc(file=sys.stderr)
         sys.stderr.flush()
 
-        error_svg = f'''<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400">
-            <circle cx="200" cy="200" r="180" fill="none" stroke="#666" stroke-width="2"/>
-            <text x="200" y="180" text-anchor="middle" font-family="Arial" font-size="16" fill="#666">
-                Chart Generation Error
-            </text>
-            <text x="200" y="220" text-anchor="middle" font-family="Arial" font-size="12" fill="#999">
-                {str(e)[:50]}
-            </text>
-        </svg>'''
-        print(error_svg)
-        sys.stdout.flush()
+        error_svg = _ERROR_SVG_TMPL.replace(
+            b'{msg}', str(e)[:50].encode('ascii', 'replace'))
+        sys.stdout.buffer.write(error_svg)
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
         sys.exit(1)
 
 